@@ -2,137 +2,181 @@
 """
 Toulmini Verification Script.
 
-Tests that all 5 tools are registered and functioning correctly.
+Tests that every expected tool is registered and functioning correctly.
 Run with: python scripts/validate_mcp.py
+
+Set TOULMINI_QUIET=1 to suppress the report and rely on the exit code.
+Long-lived runners can ``await verify()`` on their own event loop instead
+of paying for a fresh ``asyncio.run`` each time.
 """
 
 import asyncio
+import os
 import sys
 
+from toulmini.config import parse_bool
 from toulmini.server import mcp
 
+EXPECTED_TOOLS = frozenset(
+    {
+        "initiate_toulmin_sequence",
+        "initiate_toulmin_batch",
+        "inject_logic_bridge",
+        "stress_test_argument",
+        "render_verdict",
+        "format_analysis_report",
+        "consult_field_experts",
+    }
+)
+
+
+def _emit(lines):
+    """Write one report section with a single stdout call.
+
+    TOULMINI_QUIET is read on every call, so a runner can toggle it between
+    verify() runs; in quiet mode only the exit code reports the result.
+    """
+    if parse_bool(os.getenv("TOULMINI_QUIET"), False):
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
-async def main():
-    print("=" * 60)
-    print("TOULMINI LOGIC HARNESS - VERIFICATION")
-    print("=" * 60)
+def _text(result):
+    """Text of the first content block in a call_tool result ("" if empty).
+
+    FastMCP returns either the content blocks or, for tools with an output
+    schema, a (content blocks, structured output) pair.
+    """
+    blocks = result[0] if isinstance(result, tuple) else result
+    if not blocks:
+        return ""
+    text = getattr(blocks[0], "text", None)
+    return str(blocks[0]) if text is None else text
+
+
+async def verify() -> int:
+    """Run all checks and return the process exit code."""
+    _emit(["=" * 60, "TOULMINI LOGIC HARNESS - VERIFICATION", "=" * 60])
 
     # Test 1: List tools
-    print("\n[1] Checking registered tools...")
+    out = ["\n[1] Checking registered tools..."]
     try:
         tools = await mcp.list_tools()
-        print(f"    Found {len(tools)} tools:")
-        for tool in tools:
-            print(f"    ✓ {tool.name}")
+        out.append(f"    Found {len(tools)} tools:")
+        out.extend(f"    ✓ {tool.name}" for tool in tools)
 
-        expected_tools = {
-            "initiate_toulmin_sequence",
-            "inject_logic_bridge",
-            "stress_test_argument",
-            "render_verdict",
-            "format_analysis_report",
-            "consult_field_experts",
-        }
-        actual_tools = {tool.name for tool in tools}
+        actual_tools = frozenset(tool.name for tool in tools)
 
-        if actual_tools == expected_tools:
-            print("    ✓ All 6 tools registered correctly")
+        if actual_tools == EXPECTED_TOOLS:
+            out.append(f"    ✓ All {len(EXPECTED_TOOLS)} tools registered correctly")
         else:
-            missing = expected_tools - actual_tools
-            extra = actual_tools - expected_tools
+            missing = EXPECTED_TOOLS - actual_tools
+            extra = actual_tools - EXPECTED_TOOLS
             if missing:
-                print(f"    ✗ Missing tools: {missing}")
+                out.append(f"    ✗ Missing tools: {missing}")
             if extra:
-                print(f"    ⚠ Extra tools: {extra}")
-            sys.exit(1)
+                out.append(f"    ⚠ Extra tools: {extra}")
+            _emit(out)
+            return 1
     except Exception as e:
-        print(f"    ✗ Failed to list tools: {e}")
-        sys.exit(1)
-
-    # Test 2: Phase 1 - initiate_toulmin_sequence
-    print("\n[2] Testing Phase 1: initiate_toulmin_sequence...")
-    try:
-        result = await mcp.call_tool(
+        out.append(f"    ✗ Failed to list tools: {e}")
+        _emit(out)
+        return 1
+    _emit(out)
+
+    # Tests 2-4 are independent tool calls: issue them together, report in order.
+    # return_exceptions keeps one failed call from hiding the others' results.
+    phase1, council, short_query, missing_deps = await asyncio.gather(
+        mcp.call_tool(
             "initiate_toulmin_sequence", arguments={"query": "Is AI sentient?"}
-        )
-        # Result should be a list of content items
-        if result and len(result) > 0:
-            content = result[0].text if hasattr(result[0], "text") else str(result[0])
-            # Check it contains expected prompt elements
-            if "PHASE 1" in content and "DATA" in content and "CLAIM" in content:
-                print("    ✓ Phase 1 returns valid prompt structure")
-            else:
-                print("    ⚠ Phase 1 returned unexpected content")
-        else:
-            print("    ✗ Phase 1 returned empty result")
-    except Exception as e:
-        print(f"    ✗ Phase 1 failed: {e}")
-
-    # Test 2b: Helper - consult_field_experts
-    print("\n[2b] Testing Helper: consult_field_experts...")
-    try:
-        result = await mcp.call_tool(
+        ),
+        mcp.call_tool(
             "consult_field_experts",
             arguments={
                 "query": "Is AI sentient?",
                 "perspectives": ["Neuroscientist", "Philosopher"],
             },
-        )
-        content = result[0].text if hasattr(result[0], "text") else str(result[0])
-        if "Neuroscientist" in content and "Philosopher" in content:
-            print("    ✓ Council helper returns valid prompt with perspectives")
-        else:
-            print(f"    ⚠ Helper returned unexpected content: {content[:50]}")
-    except Exception as e:
-        print(f"    ✗ Helper failed: {e}")
+        ),
+        mcp.call_tool("initiate_toulmin_sequence", arguments={"query": "Hi"}),
+        mcp.call_tool(
+            "inject_logic_bridge",
+            arguments={"query": "Test", "data_json": "", "claim_json": ""},
+        ),
+        return_exceptions=True,
+    )
+
+    # A failed call or unexpected response in Tests 2-4 fails the run
+    failed = False
+
+    # Test 2: Phase 1 - initiate_toulmin_sequence
+    out = ["\n[2] Testing Phase 1: initiate_toulmin_sequence..."]
+    if isinstance(phase1, Exception):
+        out.append(f"    ✗ Phase 1 failed: {phase1}")
+        failed = True
+    elif not (content := _text(phase1)):
+        out.append("    ✗ Phase 1 returned empty result")
+        failed = True
+    # Check it contains expected prompt elements
+    elif "PHASE 1" in content and "DATA" in content and "CLAIM" in content:
+        out.append("    ✓ Phase 1 returns valid prompt structure")
+    else:
+        out.append("    ⚠ Phase 1 returned unexpected content")
+        failed = True
+    _emit(out)
+
+    # Test 2b: Helper - consult_field_experts
+    out = ["\n[2b] Testing Helper: consult_field_experts..."]
+    if isinstance(council, Exception):
+        out.append(f"    ✗ Helper failed: {council}")
+        failed = True
+    elif "Neuroscientist" in (content := _text(council)) and "Philosopher" in content:
+        out.append("    ✓ Council helper returns valid prompt with perspectives")
+    else:
+        out.append(f"    ⚠ Helper returned unexpected content: {content[:50]}")
+        failed = True
+    _emit(out)
 
     # Test 3: Query too short error
-    print("\n[3] Testing error handling (query too short)...")
-    try:
-        result = await mcp.call_tool(
-            "initiate_toulmin_sequence", arguments={"query": "Hi"}
-        )
-        content = result[0].text if hasattr(result[0], "text") else str(result[0])
-        if "QUERY_TOO_SHORT" in content:
-            print("    ✓ Short query error handled correctly")
-        else:
-            print(f"    ⚠ Unexpected response: {content[:50]}")
-    except Exception as e:
-        print(f"    ✗ Error handling test failed: {e}")
+    out = ["\n[3] Testing error handling (query too short)..."]
+    if isinstance(short_query, Exception):
+        out.append(f"    ✗ Error handling test failed: {short_query}")
+        failed = True
+    elif "QUERY_TOO_SHORT" in (content := _text(short_query)):
+        out.append("    ✓ Short query error handled correctly")
+    else:
+        out.append(f"    ⚠ Unexpected response: {content[:50]}")
+        failed = True
+    _emit(out)
 
     # Test 4: Phase 2 missing dependencies
-    print("\n[4] Testing Phase 2 dependency check...")
-    try:
-        result = await mcp.call_tool(
-            "inject_logic_bridge",
-            arguments={"query": "Test", "data_json": "", "claim_json": ""},
-        )
-        content = result[0].text if hasattr(result[0], "text") else str(result[0])
-        if "MISSING_PHASE_1_OUTPUT" in content:
-            print("    ✓ Missing dependency error handled correctly")
-        else:
-            print(f"    ⚠ Unexpected response: {content[:50]}")
-    except Exception as e:
-        print(f"    ✗ Dependency check test failed: {e}")
+    out = ["\n[4] Testing Phase 2 dependency check..."]
+    if isinstance(missing_deps, Exception):
+        out.append(f"    ✗ Dependency check test failed: {missing_deps}")
+        failed = True
+    elif "MISSING_PHASE_1_OUTPUT" in (content := _text(missing_deps)):
+        out.append("    ✓ Missing dependency error handled correctly")
+    else:
+        out.append(f"    ⚠ Unexpected response: {content[:50]}")
+        failed = True
+    _emit(out)
 
     # Test 5: Check tool descriptions contain examples
-    print("\n[5] Checking tool documentation quality...")
+    out = ["\n[5] Checking tool documentation quality..."]
     docs_quality = True
     for tool in tools:
-        desc = tool.description or ""
-        if "Example" in desc or "example" in desc:
-            print(f"    ✓ {tool.name}: Has examples in description")
+        if "example" in (tool.description or "").lower():
+            out.append(f"    ✓ {tool.name}: Has examples in description")
         else:
-            print(f"    ⚠ {tool.name}: Missing examples in description")
+            out.append(f"    ⚠ {tool.name}: Missing examples in description")
             docs_quality = False
 
     if docs_quality:
-        print("    ✓ All tools have documented examples")
+        out.append("    ✓ All tools have documented examples")
+    _emit(out)
 
-    print("\n" + "=" * 60)
-    print("VERIFICATION COMPLETE")
-    print("=" * 60)
+    _emit(["\n" + "=" * 60, "VERIFICATION COMPLETE", "=" * 60])
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(asyncio.run(verify()))
@@ -4,7 +4,8 @@ Toulmini: A Logic Compiler for Arguments.
 Bad logic = crash. Weak backing = termination. No appeals.
 """
 
-from .server import main, mcp
+from typing import TYPE_CHECKING
+
 from .models import (
     ToulminChain,
     Data,
@@ -19,6 +20,9 @@ from .models import (
     VerdictStatus,
 )
 
+if TYPE_CHECKING:
+    from .server import main, mcp
+
 __version__ = "2.0.0"
 __all__ = [
     "main",
@@ -35,3 +39,13 @@ __all__ = [
     "StrengthLevel",
     "VerdictStatus",
 ]
+
+
+def __getattr__(name: str):
+    # The server (and FastMCP behind it) loads on first access, so importing
+    # toulmini.cli or toulmini.models stays cheap.
+    if name in {"main", "mcp"}:
+        from . import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
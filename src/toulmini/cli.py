@@ -3,40 +3,63 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
-from dataclasses import asdict
+from dataclasses import fields
 from pathlib import Path
 from typing import Iterable, Tuple
 
 from .config import Config, get_config
 from .mcp_setup import (
+    _cached_generate_config,
     _write_config,
-    generate_config,
     get_project_root,
-    get_python_path,
     is_installed_in_site_packages,
     print_setup_instructions,
 )
-from .server import mcp
 
 _DEFAULT_INSTALL_TARGET = "mcp_config.json"
-_EXPECTED_TOOLS = {
-    "consult_field_experts",
-    "initiate_toulmin_sequence",
-    "inject_logic_bridge",
-    "stress_test_argument",
-    "render_verdict",
-    "format_analysis_report",
-}
+# Public Config fields, resolved once so --config skips dataclass reflection.
+_CONFIG_KEYS = tuple(f.name for f in fields(Config) if f.name != "_initial_env")
+_EXPECTED_TOOLS_SORTED = tuple(
+    sorted(
+        {
+            "consult_field_experts",
+            "initiate_toulmin_sequence",
+            "initiate_toulmin_batch",
+            "inject_logic_bridge",
+            "stress_test_argument",
+            "render_verdict",
+            "format_analysis_report",
+        }
+    )
+)
 
 
 def _render_config(config: Config) -> str:
-    payload = asdict(config)
+    # Shallow copy: Config is flat, so asdict()'s recursive deepcopy is wasted.
+    payload = {key: getattr(config, key) for key in _CONFIG_KEYS}
     payload["_initial_env"] = dict(config._initial_env)
     return json.dumps(payload, indent=2)
 
 
+def _registered_tool_names() -> set[str]:
+    """Return registered tool names without spinning up an event loop.
+
+    Reads FastMCP's in-memory tool manager directly; falls back to the async
+    ``list_tools()`` API if that private attribute is ever removed.
+    """
+    # Deferred: importing the server pulls in FastMCP, which --config and
+    # --install never need.
+    from .server import mcp
+
+    tool_manager = getattr(mcp, "_tool_manager", None)
+    if tool_manager is not None:
+        return {tool.name for tool in tool_manager.list_tools()}
+    import asyncio
+
+    return {tool.name for tool in asyncio.run(mcp.list_tools())}
+
+
 def _verify_environment() -> Tuple[bool, Iterable[Tuple[bool, str]]]:
     messages: list[Tuple[bool, str]] = []
     ok = True
@@ -49,9 +72,8 @@ def _verify_environment() -> Tuple[bool, Iterable[Tuple[bool, str]]]:
         messages.append((False, f"Config error: {exc}"))
 
     try:
-        tools = asyncio.run(mcp.list_tools())
-        tool_names = {tool.name for tool in tools}
-        missing = sorted(_EXPECTED_TOOLS - tool_names)
+        tool_names = _registered_tool_names()
+        missing = [name for name in _EXPECTED_TOOLS_SORTED if name not in tool_names]
         if missing:
             ok = False
             messages.append((False, f"Server missing tools: {', '.join(missing)}"))
@@ -62,11 +84,11 @@ def _verify_environment() -> Tuple[bool, Iterable[Tuple[bool, str]]]:
         messages.append((False, f"Server error: {exc}"))
 
     try:
-        python_path = get_python_path()
         is_installed = is_installed_in_site_packages()
         project_root = get_project_root()
-        config_dict = generate_config(python_path, project_root, is_installed)
-        json.dumps(config_dict)
+        # generate_config emits only JSON-safe primitives (covered by
+        # test_config_snippet_is_json_serializable), so no dry-run encode here.
+        _cached_generate_config()
         status = "installed" if is_installed else f"source ({project_root})"
         messages.append((True, f"MCP config ready via {status}"))
     except Exception as exc:  # pragma: no cover - defensive
@@ -77,11 +99,7 @@ def _verify_environment() -> Tuple[bool, Iterable[Tuple[bool, str]]]:
 
 
 def _handle_install(target: str | None) -> None:
-    python_path = get_python_path()
-    is_installed = is_installed_in_site_packages()
-    project_root = get_project_root()
-    config = generate_config(python_path, project_root, is_installed)
-    snippet = config["mcpServers"]
+    snippet = _cached_generate_config()["mcpServers"]
 
     if target == "-":
         print_setup_instructions(dry_run=False)
@@ -9,43 +9,57 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Any, Dict
+from typing import Any, Optional, Tuple
 
 
 class ConfigurationError(RuntimeError):
     """Raised when configuration is invalid or misconfigured."""
 
 
-def _get_env_bool(name: str, default: bool) -> bool:
-    """Parse boolean from environment variable.
+# Every environment variable read by get_config(), in snapshot order.
+_ENV_KEYS = (
+    "TOULMINI_ENABLE_COUNCIL",
+    "TOULMINI_STRICT_MODE",
+    "TOULMINI_FAIL_ON_WEAK_WARRANT",
+    "TOULMINI_FAIL_ON_WEAK_BACKING",
+    "TOULMINI_DEBUG",
+    "TOULMINI_LOG_LEVEL",
+)
+
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+# Common spellings of _FALSE_VALUES, matched without allocating via lower().
+_FALSE_SPELLINGS = frozenset(
+    spelling
+    for value in _FALSE_VALUES
+    for spelling in (value, value.capitalize(), value.upper())
+)
+
+_MAX_FALSE_LEN = max(map(len, _FALSE_VALUES))
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+def parse_bool(raw: Optional[str], default: bool) -> bool:
+    """Parse boolean from a raw environment value.
 
     Treats '0', 'false', 'no', 'off' (case-insensitive) as False.
     All other non-empty values are treated as True.
 
     Args:
-        name: Environment variable name
+        raw: Raw environment value, or None if unset
         default: Default value if variable not set
 
     Returns:
         Parsed boolean value
     """
-    raw = os.getenv(name)
     if raw is None:
         return default
-    return raw.strip().lower() not in {"0", "false", "no", "off"}
-
-
-def _get_env_str(name: str, default: str) -> str:
-    """Get string from environment variable.
-
-    Args:
-        name: Environment variable name
-        default: Default value if variable not set
-
-    Returns:
-        Environment variable value or default
-    """
-    return os.getenv(name, default)
+    value = raw.strip()
+    if value in _FALSE_SPELLINGS:
+        return False
+    # Only short values can still be a mixed-case falsy spelling (e.g. "fAlSe").
+    return len(value) > _MAX_FALSE_LEN or value.lower() not in _FALSE_VALUES
 
 
 def _get_env_int(name: str, default: int) -> int:
@@ -110,8 +124,10 @@ class Config:
     """Logging level: DEBUG, INFO, WARNING, ERROR."""
 
     # Internal state (not configurable via env vars)
-    _initial_env: Dict[str, Any] = field(default_factory=dict, repr=False)
-    """Snapshot of initial environment variables for testing/debugging."""
+    _initial_env: Tuple[Tuple[str, Optional[str]], ...] = field(
+        default_factory=tuple, repr=False
+    )
+    """Read-only (name, raw value) snapshot of initial environment variables."""
 
 
 @lru_cache(maxsize=1)
@@ -136,33 +152,30 @@ def get_config() -> Config:
         >>> config = get_config()
         >>> assert config.strict_mode is False
     """
+    # Read each variable exactly once; typed values and snapshot share it.
+    raw = {key: os.getenv(key) for key in _ENV_KEYS}
+    log_level = raw["TOULMINI_LOG_LEVEL"]
+
     config = Config(
         # Feature toggles
-        enable_council=_get_env_bool("TOULMINI_ENABLE_COUNCIL", True),
+        enable_council=parse_bool(raw["TOULMINI_ENABLE_COUNCIL"], True),
         # Circuit breaker controls
-        strict_mode=_get_env_bool("TOULMINI_STRICT_MODE", True),
-        fail_on_weak_warrant=_get_env_bool("TOULMINI_FAIL_ON_WEAK_WARRANT", True),
-        fail_on_weak_backing=_get_env_bool("TOULMINI_FAIL_ON_WEAK_BACKING", True),
+        strict_mode=parse_bool(raw["TOULMINI_STRICT_MODE"], True),
+        fail_on_weak_warrant=parse_bool(raw["TOULMINI_FAIL_ON_WEAK_WARRANT"], True),
+        fail_on_weak_backing=parse_bool(raw["TOULMINI_FAIL_ON_WEAK_BACKING"], True),
         # Debugging
-        debug=_get_env_bool("TOULMINI_DEBUG", False),
-        log_level=_get_env_str("TOULMINI_LOG_LEVEL", "INFO").upper(),
+        debug=parse_bool(raw["TOULMINI_DEBUG"], False),
+        log_level=(log_level if log_level is not None else "INFO").upper(),
     )
 
     # Store initial environment snapshot for debugging
-    config._initial_env = {
-        "TOULMINI_ENABLE_COUNCIL": os.getenv("TOULMINI_ENABLE_COUNCIL"),
-        "TOULMINI_STRICT_MODE": os.getenv("TOULMINI_STRICT_MODE"),
-        "TOULMINI_FAIL_ON_WEAK_WARRANT": os.getenv("TOULMINI_FAIL_ON_WEAK_WARRANT"),
-        "TOULMINI_FAIL_ON_WEAK_BACKING": os.getenv("TOULMINI_FAIL_ON_WEAK_BACKING"),
-        "TOULMINI_DEBUG": os.getenv("TOULMINI_DEBUG"),
-        "TOULMINI_LOG_LEVEL": os.getenv("TOULMINI_LOG_LEVEL"),
-    }
+    config._initial_env = tuple((key, raw[key]) for key in _ENV_KEYS)
 
     # Validate log level
-    valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-    if config.log_level not in valid_log_levels:
+    if config.log_level not in _VALID_LOG_LEVELS:
         raise ConfigurationError(
-            f"TOULMINI_LOG_LEVEL must be one of {valid_log_levels}. Got: {config.log_level}"
+            f"TOULMINI_LOG_LEVEL must be one of {sorted(_VALID_LOG_LEVELS)}. "
+            f"Got: {config.log_level}"
         )
 
     return config
@@ -224,6 +237,7 @@ __all__ = [
     "Config",
     "ConfigurationError",
     "get_config",
+    "parse_bool",
     "set_config_value",
     "reset_config",
 ]
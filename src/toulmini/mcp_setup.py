@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import site
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -28,42 +29,36 @@ Note: After modifying the config, quit and reopen Claude Desktop for changes to
 """
 
 
+@lru_cache(maxsize=1)
 def _package_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
+@lru_cache(maxsize=1)
 def get_python_path() -> str:
     """Return the current Python executable path."""
 
     return sys.executable
 
 
+@lru_cache(maxsize=1)
 def is_installed_in_site_packages() -> bool:
     """Detect whether Toulmini is installed from site-packages."""
 
     package_path = _package_dir()
 
-    site_packages = []
     try:
-        site_packages = site.getsitepackages()  # type: ignore[attr-defined]
-    except AttributeError:
-        pass
+        candidates = [*site.getsitepackages(), site.getusersitepackages()]  # type: ignore[attr-defined]
+    except AttributeError:  # legacy virtualenv site module lacks getsitepackages
+        candidates = [site.getusersitepackages()]
 
-    for site_package in site_packages:
-        if site_package and str(package_path).startswith(site_package):
-            return True
-
-    try:
-        user_site = site.getusersitepackages()
-    except AttributeError:
-        user_site = None
-
-    if user_site and str(package_path).startswith(user_site):
-        return True
-
-    return False
+    # Resolve both sides: a symlinked site-packages (macOS, venvs) must still match.
+    return any(
+        package_path.is_relative_to(Path(sp).resolve()) for sp in candidates if sp
+    )
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Best-effort detection of the project root.
 
@@ -75,7 +70,7 @@ def get_project_root() -> Path:
 
     candidates = [package_dir.parent.parent, package_dir.parent]
     for candidate in candidates:
-        if candidate and (candidate / "pyproject.toml").exists():
+        if (candidate / "pyproject.toml").exists():
             return candidate
 
     return package_dir
@@ -106,59 +101,73 @@ def generate_config(
     return config
 
 
-def print_setup_instructions(dry_run: bool = False) -> None:
-    """Print human-readable instructions and JSON snippet."""
+@lru_cache(maxsize=1)
+def _cached_generate_config() -> Dict[str, dict]:
+    """Return the MCP config for the running interpreter, computed once.
 
-    python_path = get_python_path()
-    is_installed = is_installed_in_site_packages()
-    project_root = get_project_root()
+    Callers must treat the result as read-only; it is shared across calls.
+    """
+
+    return generate_config(
+        get_python_path(), get_project_root(), is_installed_in_site_packages()
+    )
 
-    config = generate_config(python_path, project_root, is_installed)
-    snippet = config["mcpServers"]
-    json_output = json.dumps(snippet, indent=2)
+
+@lru_cache(maxsize=1)
+def _snippet_json() -> str:
+    """Return the indented JSON for the cached ``mcpServers`` snippet."""
+
+    return json.dumps(_cached_generate_config()["mcpServers"], indent=2)
+
+
+def print_setup_instructions(dry_run: bool = False) -> None:
+    """Print human-readable instructions and JSON snippet."""
 
     if dry_run:
         return
 
-    print("\n" + "=" * 70)
-    print("TOULMINI MCP CONFIGURATION SNIPPET")
-    print("=" * 70)
-    print("Copy the snippet below into your 'Global MCP Settings' (Cursor)")
-    print("or your MCP configuration file:")
-    print("-" * 70)
-    print(json_output)
-    print("-" * 70)
-
-    print("\nTools available:")
-    print("  - initiate_toulmin_sequence (Phase 1: DATA + CLAIM)")
-    print("  - inject_logic_bridge (Phase 2: WARRANT + BACKING)")
-    print("  - stress_test_argument (Phase 3: REBUTTAL + QUALIFIER)")
-    print("  - render_verdict (Phase 4: VERDICT)")
-    print("  - format_analysis_report (Phase 5: Markdown report)")
-    print("  - consult_field_experts (Helper: Council of Experts)")
-
-    print("\nCommon config paths:")
-    print(
-        "  macOS Claude Desktop: ~/Library/Application Support/Claude/claude_desktop_config.json"
-    )
-    print("  Cursor:               ~/.cursor/mcp_config.json")
-    print("  Windsurf:             ~/.codeium/windsurf/mcp_config.json")
-
-    print(
-        "\n⚠️  Restart Required: Quit and reopen Claude Desktop after modifying the config."
-    )
+    is_installed = is_installed_in_site_packages()
+    project_root = get_project_root()
+    json_output = _snippet_json()
+
+    lines = [
+        "\n" + "=" * 70,
+        "TOULMINI MCP CONFIGURATION SNIPPET",
+        "=" * 70,
+        "Copy the snippet below into your 'Global MCP Settings' (Cursor)",
+        "or your MCP configuration file:",
+        "-" * 70,
+        json_output,
+        "-" * 70,
+        "\nTools available:",
+        "  - initiate_toulmin_sequence (Phase 1: DATA + CLAIM)",
+        "  - initiate_toulmin_batch (Phase 1 for many queries at once)",
+        "  - inject_logic_bridge (Phase 2: WARRANT + BACKING)",
+        "  - stress_test_argument (Phase 3: REBUTTAL + QUALIFIER)",
+        "  - render_verdict (Phase 4: VERDICT)",
+        "  - format_analysis_report (Phase 5: Markdown report)",
+        "  - consult_field_experts (Helper: Council of Experts)",
+        "\nCommon config paths:",
+        "  macOS Claude Desktop: ~/Library/Application Support/Claude/claude_desktop_config.json",
+        "  Cursor:               ~/.cursor/mcp_config.json",
+        "  Windsurf:             ~/.codeium/windsurf/mcp_config.json",
+        "\n⚠️  Restart Required: Quit and reopen Claude Desktop after modifying the config.",
+    ]
 
     if not is_installed:
-        print(f"\nℹ️  NOTE: Detected source installation at {project_root}")
-        print("   Added PYTHONPATH to ensure the server runs correctly.")
+        lines.append(f"\nℹ️  NOTE: Detected source installation at {project_root}")
+        lines.append("   Added PYTHONPATH to ensure the server runs correctly.")
     else:
-        print("\nℹ️  NOTE: Detected installed package.")
+        lines.append("\nℹ️  NOTE: Detected installed package.")
 
-    print("\nFor automated setup, run:")
-    print(
+    lines.append("\nFor automated setup, run:")
+    lines.append(
         '  toulmini-setup-mcp --write "$HOME/Library/Application Support/Claude/claude_desktop_config.json"'
     )
 
+    # One write instead of ~25 print() calls (one lock/flush each).
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def _write_config(target: Path, snippet: dict) -> None:
     """Write MCP config to a given file."""
@@ -168,7 +177,7 @@ def _write_config(target: Path, snippet: dict) -> None:
 
     if target.exists():
         try:
-            existing = json.loads(target.read_text(encoding="utf-8"))
+            existing = json.loads(target.read_bytes())
         except (json.JSONDecodeError, UnicodeDecodeError):
             print(
                 f"⚠️  Warning: Existing config at {target} is invalid. Creating new file."
@@ -185,7 +194,7 @@ def _write_config(target: Path, snippet: dict) -> None:
     else:
         payload = {"mcpServers": snippet}
 
-    target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    target.write_bytes(json.dumps(payload, indent=2).encode("utf-8"))
     print(f"✅ Wrote MCP config to {target}")
     print("\n⚠️  Remember to restart Claude Desktop for changes to take effect!")
 
@@ -3,6 +3,7 @@
 from .base import (
     Citation,
     StrengthLevel,
+    WEAK_STRENGTHS,
     VerdictStatus,
     QualifierForce,
     LogicType,
@@ -22,6 +23,7 @@ from .chain import ToulminChain
 __all__ = [
     "Citation",
     "StrengthLevel",
+    "WEAK_STRENGTHS",
     "VerdictStatus",
     "QualifierForce",
     "LogicType",
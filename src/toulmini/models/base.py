@@ -8,6 +8,10 @@ from pydantic import BaseModel, Field, ConfigDict
 # Used by Backing, Rebuttal, Warrant
 StrengthLevel = Literal["absolute", "strong", "weak", "irrelevant"]
 
+# Strengths that terminate the chain when they appear on a Warrant or Backing.
+# A frozenset keeps the circuit breaker's happy path to one membership test.
+WEAK_STRENGTHS: frozenset[str] = frozenset({"weak", "irrelevant"})
+
 # === VERDICT STATUS ===
 # Legal terminology: the argument's fate
 VerdictStatus = Literal["sustained", "overruled", "remanded"]
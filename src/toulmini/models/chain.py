@@ -6,6 +6,25 @@ from typing_extensions import Self
 
 from .components import Data, Claim, Warrant, Backing, Rebuttal, Qualifier, Verdict
 
+# (component, prerequisite) pairs for the sequential phase dependencies.
+_DEPENDENCIES = (
+    ("claim", "data"),
+    ("warrant", "claim"),
+    ("backing", "warrant"),
+    ("rebuttal", "backing"),
+    ("qualifier", "rebuttal"),
+)
+
+# Components a Verdict depends on, in phase order (names used in error messages).
+_VERDICT_PREREQUISITES = (
+    "Data",
+    "Claim",
+    "Warrant",
+    "Backing",
+    "Rebuttal",
+    "Qualifier",
+)
+
 
 class ToulminChain(BaseModel):
     """
@@ -30,42 +49,31 @@ class ToulminChain(BaseModel):
     def enforce_dependencies(self) -> Self:
         """Crash if dependencies are violated."""
 
-        # Claim requires Data
-        if self.claim and not self.data:
-            raise ValueError("CHAIN ERROR: Claim requires Data.")
-
-        # Warrant requires Claim
-        if self.warrant and not self.claim:
-            raise ValueError("CHAIN ERROR: Warrant requires Claim.")
-
-        # Backing requires Warrant
-        if self.backing and not self.warrant:
-            raise ValueError("CHAIN ERROR: Backing requires Warrant.")
-
-        # Rebuttal requires Backing
-        if self.rebuttal and not self.backing:
-            raise ValueError("CHAIN ERROR: Rebuttal requires Backing.")
-
-        # Qualifier requires Rebuttal
-        if self.qualifier and not self.rebuttal:
-            raise ValueError("CHAIN ERROR: Qualifier requires Rebuttal.")
+        # Each phase requires the one before it (Claim→Data, ..., Qualifier→Rebuttal)
+        for component, prerequisite in _DEPENDENCIES:
+            if getattr(self, component) and not getattr(self, prerequisite):
+                raise ValueError(
+                    f"CHAIN ERROR: {component.capitalize()} requires "
+                    f"{prerequisite.capitalize()}."
+                )
 
         # Verdict requires all
         if self.verdict:
-            missing = []
-            if not self.data:
-                missing.append("Data")
-            if not self.claim:
-                missing.append("Claim")
-            if not self.warrant:
-                missing.append("Warrant")
-            if not self.backing:
-                missing.append("Backing")
-            if not self.rebuttal:
-                missing.append("Rebuttal")
-            if not self.qualifier:
-                missing.append("Qualifier")
-            if missing:
+            prerequisites = (
+                self.data,
+                self.claim,
+                self.warrant,
+                self.backing,
+                self.rebuttal,
+                self.qualifier,
+            )
+            # Happy path: one all() over the tuple, no list built.
+            if not all(prerequisites):
+                missing = [
+                    name
+                    for name, component in zip(_VERDICT_PREREQUISITES, prerequisites)
+                    if not component
+                ]
                 raise ValueError(f"CHAIN ERROR: Verdict requires {', '.join(missing)}.")
 
         return self
@@ -1,5 +1,6 @@
 """The 7 Toulmin components. Strict Pydantic. Logic Compiler."""
 
+import re
 from typing import List
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 from typing_extensions import Self
@@ -7,6 +8,7 @@ from typing_extensions import Self
 from .base import (
     Citation,
     StrengthLevel,
+    WEAK_STRENGTHS,
     VerdictStatus,
     QualifierForce,
     LogicType,
@@ -14,10 +16,16 @@ from .base import (
 )
 
 
+# Verdict consistency scans: one case-insensitive C-level search per check,
+# instead of lower()-copying the reasoning and testing each term separately.
+_FAILURE_TERMS = re.compile(r"fails|rejected", re.IGNORECASE)
+_SUCCESS_TERMS = re.compile(r"succeeds|sustained", re.IGNORECASE)
+
+
 class Data(BaseModel):
     """DATA (Grounds): Raw facts. No facts = no argument."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     facts: List[str] = Field(..., min_length=1)
     citations: List[Citation] = Field(..., min_length=1)
@@ -27,14 +35,14 @@ class Data(BaseModel):
 class Claim(BaseModel):
     """CLAIM: The assertion. Must be falsifiable."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     statement: str = Field(..., min_length=10)
     scope: str = Field(..., description="universal|general|specific|singular")
 
     @model_validator(mode="after")
     def no_questions(self) -> Self:
-        if self.statement.strip().endswith("?"):
+        if self.statement.rstrip().endswith("?"):
             raise ValueError("CLAIM REJECTED: Claims are assertions, not questions.")
         return self
 
@@ -42,7 +50,7 @@ class Claim(BaseModel):
 class Warrant(BaseModel):
     """WARRANT: The logical bridge. If weak, the argument collapses."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     principle: str = Field(..., min_length=20)
     logic_type: LogicType
@@ -50,6 +58,8 @@ class Warrant(BaseModel):
 
     def logic_check(self) -> None:
         """HARD REJECTION: Weak warrants crash the argument."""
+        if self.strength not in WEAK_STRENGTHS:
+            return
         if self.strength == "weak":
             raise ValueError(
                 "WARRANT REJECTED: Strength is 'weak'. "
@@ -65,7 +75,7 @@ class Warrant(BaseModel):
 class Backing(BaseModel):
     """BACKING: Authority behind the Warrant. Weak backing = no foundation."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     authority: str = Field(..., min_length=10)
     citations: List[Citation] = Field(..., min_length=1)
@@ -73,6 +83,8 @@ class Backing(BaseModel):
 
     def logic_check(self) -> None:
         """HARD REJECTION: Weak backing crashes the argument."""
+        if self.strength not in WEAK_STRENGTHS:
+            return
         if self.strength == "weak":
             raise ValueError(
                 "BACKING REJECTED: Strength is 'weak'. "
@@ -88,7 +100,7 @@ class Backing(BaseModel):
 class Rebuttal(BaseModel):
     """REBUTTAL: The attack vector. Must find weaknesses or admit there are none."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     exceptions: List[str] = Field(..., min_length=1)
     counterexamples: List[str] = Field(default=[])
@@ -106,7 +118,7 @@ class Rebuttal(BaseModel):
 class Qualifier(BaseModel):
     """QUALIFIER: Degree of certainty. Honest assessment required."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     degree: QualifierForce
     confidence_pct: int = Field(..., ge=0, le=100)
@@ -116,7 +128,7 @@ class Qualifier(BaseModel):
 class Verdict(BaseModel):
     """VERDICT: The final judgment. No appeals."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     status: VerdictStatus
     reasoning: str = Field(..., min_length=50)
@@ -125,18 +137,16 @@ class Verdict(BaseModel):
     @model_validator(mode="after")
     def validate_consistency(self) -> Self:
         """Verdict must be internally consistent."""
-        reasoning_lower = self.reasoning.lower()
-
         # If sustained, reasoning shouldn't say it fails
         if self.status == "sustained":
-            if "fails" in reasoning_lower or "rejected" in reasoning_lower:
+            if _FAILURE_TERMS.search(self.reasoning):
                 raise ValueError(
                     "VERDICT INCONSISTENT: Status is 'sustained' but reasoning suggests failure."
                 )
 
         # If overruled, reasoning shouldn't say it succeeds
         if self.status == "overruled":
-            if "succeeds" in reasoning_lower or "sustained" in reasoning_lower:
+            if _SUCCESS_TERMS.search(self.reasoning):
                 raise ValueError(
                     "VERDICT INCONSISTENT: Status is 'overruled' but reasoning suggests success."
                 )
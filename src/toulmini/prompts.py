@@ -31,31 +31,23 @@ VIOLATION = TERMINATION."""
 # =============================================================================
 
 
-def prompt_consult_experts(query: str, perspectives: list[str]) -> str:
-    """
-    HELPER: Convene a council of experts to generate raw arguments.
-
-    Common perspective examples:
-    - Ethics: 'Utilitarian Ethicist', 'Deontologist', 'Virtue Ethicist'
-    - Science: 'Empirical Scientist', 'Skeptical Researcher', 'Domain Expert'
-    - Law: 'Constitutional Scholar', 'Legal Realist', 'Civil Libertarian'
-    - Policy: 'Economist', 'Sociologist', 'Public Health Expert'
-
-    Integration guidance:
-    - Use 'argument_for' to enrich Backing in Phase 2
-    - Use 'argument_against' to seed Rebuttals in Phase 3
-    """
-    perspectives_str = ", ".join(perspectives)
-    return f"""{SYSTEM_DIRECTIVE}
+_CONSULT_EXPERTS_HEAD = (
+    SYSTEM_DIRECTIVE
+    + """
 
 ═══════════════════════════════════════════════════════════════════════════════
 HELPER: CONSULT THE COUNCIL OF EXPERTS
 ═══════════════════════════════════════════════════════════════════════════════
 
-QUERY: {query}
+QUERY: """
+)
+
+_CONSULT_EXPERTS_MID = """
 
 REQUIRED PERSPECTIVES (The Council):
-{perspectives_str}
+"""
+
+_CONSULT_EXPERTS_TAIL = """
 
 YOUR TASK:
 You must simulate the viewpoints of these specific experts/personas.
@@ -71,34 +63,62 @@ INTEGRATION GUIDANCE:
 - key_citation: Provide authoritative sources for this perspective's view
 
 OUTPUT SCHEMA:
-{{
+{
   "council_opinions": [
-    {{
+    {
       "perspective": "string (e.g., 'Utilitarian Ethicist')",
       "argument_for": "string (strongest point in favor)",
       "argument_against": "string (strongest point against)",
       "key_citation": "string (a likely source/authority for this view)"
-    }}
+    }
   ]
-}}
+}
 
 EMIT JSON. NOTHING ELSE."""
 
 
+def prompt_consult_experts(query: str, perspectives: list[str]) -> str:
+    """
+    HELPER: Convene a council of experts to generate raw arguments.
+
+    Common perspective examples:
+    - Ethics: 'Utilitarian Ethicist', 'Deontologist', 'Virtue Ethicist'
+    - Science: 'Empirical Scientist', 'Skeptical Researcher', 'Domain Expert'
+    - Law: 'Constitutional Scholar', 'Legal Realist', 'Civil Libertarian'
+    - Policy: 'Economist', 'Sociologist', 'Public Health Expert'
+
+    Integration guidance:
+    - Use 'argument_for' to enrich Backing in Phase 2
+    - Use 'argument_against' to seed Rebuttals in Phase 3
+    """
+    return "".join(
+        (
+            _CONSULT_EXPERTS_HEAD,
+            query,
+            _CONSULT_EXPERTS_MID,
+            ", ".join(perspectives),
+            _CONSULT_EXPERTS_TAIL,
+        )
+    )
+
+
 # =============================================================================
 # PHASE 1: DATA + CLAIM
 # =============================================================================
 
 
-def prompt_phase_one(query: str) -> str:
-    """PHASE 1: Extract DATA and construct CLAIM. No hedging."""
-    return f"""{SYSTEM_DIRECTIVE}
+_PHASE_ONE_HEAD = (
+    SYSTEM_DIRECTIVE
+    + """
 
 ═══════════════════════════════════════════════════════════════════════════════
 PHASE 1: DATA EXTRACTION + CLAIM CONSTRUCTION
 ═══════════════════════════════════════════════════════════════════════════════
 
-QUERY: {query}
+QUERY: """
+)
+
+_PHASE_ONE_TAIL = """
 
 YOUR TASK:
 You are forbidden from answering the query. You must ONLY:
@@ -110,20 +130,20 @@ RULES:
 - Each fact requires a citation (source + reference).
 - CLAIM must be an assertion, NOT a question.
 - CLAIM must NOT contain hedging words (might, could, perhaps, possibly).
-- If you cannot find credible data, output: {{"error": "INSUFFICIENT_DATA"}}
+- If you cannot find credible data, output: {"error": "INSUFFICIENT_DATA"}
 
 OUTPUT SCHEMA:
-{{
-  "data": {{
+{
+  "data": {
     "facts": ["string"],
-    "citations": [{{"source": "string", "reference": "string", "url": "string|null"}}],
+    "citations": [{"source": "string", "reference": "string", "url": "string|null"}],
     "evidence_type": "empirical|statistical|testimonial|documentary|expert"
-  }},
-  "claim": {{
+  },
+  "claim": {
     "statement": "string (min 10 chars, no hedging)",
     "scope": "universal|general|specific|singular"
-  }}
-}}
+  }
+}
 
 CITATION URL RULE:
 - Include "url" ONLY if you know the exact URL with certainty.
@@ -133,6 +153,11 @@ CITATION URL RULE:
 EMIT JSON. NOTHING ELSE."""
 
 
+def prompt_phase_one(query: str) -> str:
+    """PHASE 1: Extract DATA and construct CLAIM. No hedging."""
+    return "".join((_PHASE_ONE_HEAD, query, _PHASE_ONE_TAIL))
+
+
 # =============================================================================
 # PHASE 2: WARRANT + BACKING
 # =============================================================================
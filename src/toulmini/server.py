@@ -5,12 +5,17 @@ A Logic Harness for arguments. Bad logic = crash.
 Implements Stephen Toulmin's argumentation model across 4 sequential phases.
 """
 
+import json
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 
 from mcp.server.fastmcp import FastMCP
 
 from .config import get_config
+from .models.components import Backing, Warrant
 from .prompts import (
     prompt_phase_one,
     prompt_phase_two,
@@ -34,6 +39,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger("toulmini")
 
+
+def _start_log_listener() -> QueueListener:
+    """Hand stderr writes to a background thread so a slow host never blocks a tool call."""
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+# === ERROR RESPONSES ===
+# Fixed error payloads returned by the input gates, built once.
+_ERR_COUNCIL_DISABLED = '{"error": "COUNCIL_DISABLED"}'
+_ERR_NO_PERSPECTIVES_PROVIDED = '{"error": "NO_PERSPECTIVES_PROVIDED"}'
+_ERR_QUERY_TOO_SHORT = '{"error": "QUERY_TOO_SHORT"}'
+_ERR_NO_QUERIES_PROVIDED = '{"error": "NO_QUERIES_PROVIDED"}'
+_ERR_MISSING_PHASE_1_OUTPUT = '{"error": "MISSING_PHASE_1_OUTPUT"}'
+_ERR_INCOMPLETE_CHAIN = '{"error": "INCOMPLETE_CHAIN"}'
+
+
+def _reason_error(error: str, exc: Exception) -> str:
+    """Error payload carrying an exception message, escaped as valid JSON."""
+    return json.dumps({"error": error, "reason": str(exc)})
+
+
 # === SERVER ===
 
 MCP_INSTRUCTIONS = """
@@ -120,6 +151,7 @@ or "let me see each phase"), then pause after each phase for user confirmation.
 |-------|------|----------|-------|
 | Helper | consult_field_experts | council_opinions | Use for complex/contested queries |
 | 1 | initiate_toulmin_sequence | data, claim | Foundation phase |
+| 1 (batch) | initiate_toulmin_batch | data, claim per query | Phase 1 prompts for many queries |
 | 2 | inject_logic_bridge | warrant, backing | Integrate Council backing here |
 | 3 | stress_test_argument | rebuttal, qualifier | Integrate Council rebuttals here |
 | 4 | render_verdict | verdict | Final judgment |
@@ -148,12 +180,12 @@ def consult_field_experts(query: str, perspectives: list[str]) -> str:
     config = get_config()
     if not config.enable_council:
         logger.warning("Council disabled via configuration toggle")
-        return '{"error": "COUNCIL_DISABLED"}'
+        return _ERR_COUNCIL_DISABLED
 
     if not perspectives:
-        return '{"error": "NO_PERSPECTIVES_PROVIDED"}'
+        return _ERR_NO_PERSPECTIVES_PROVIDED
 
-    logger.info(f"Council convened: {perspectives} on '{query[:30]}...'")
+    logger.info("Council convened: %s on '%.30s...'", perspectives, query)
     return prompt_consult_experts(query, perspectives)
 
 
@@ -180,10 +212,43 @@ def initiate_toulmin_sequence(query: str) -> str:
         3. Save the data_json and claim_json from the response
         4. Pass them to inject_logic_bridge
     """
-    logger.info(f"Phase 1 initiated: {query[:50]}...")
-    if len(query.strip()) < 5:
-        return '{"error": "QUERY_TOO_SHORT"}'
-    return prompt_phase_one(query.strip())
+    logger.info("Phase 1 initiated: %.50s...", query)
+    stripped = query.strip()
+    if len(stripped) < 5:
+        return _ERR_QUERY_TOO_SHORT
+    return prompt_phase_one(stripped)
+
+
+@mcp.tool()
+def initiate_toulmin_batch(queries: list[str]) -> str:
+    """
+    BATCH PHASE 1: Build Phase 1 prompts for many queries in one call.
+
+    Use this for evaluations or dataset scoring instead of calling
+    initiate_toulmin_sequence once per query. Submit the returned prompts
+    through your provider's batch API, then continue each query through
+    Phases 2-4 individually.
+
+    Args:
+        queries: The propositions to analyze.
+            Example: ["Is remote work more productive?", "Should AI be regulated?"]
+
+    Returns:
+        A JSON array with one entry per query, in input order. Each entry is the
+        Phase 1 prompt, or '{"error": "QUERY_TOO_SHORT"}' for a rejected query.
+    """
+    if not queries:
+        return _ERR_NO_QUERIES_PROVIDED
+
+    logger.info("Phase 1 batch initiated: %d queries", len(queries))
+    prompts = []
+    for query in queries:
+        stripped = query.strip()
+        if len(stripped) < 5:
+            prompts.append(_ERR_QUERY_TOO_SHORT)
+        else:
+            prompts.append(prompt_phase_one(stripped))
+    return json.dumps(prompts)
 
 
 @mcp.tool()
@@ -211,7 +276,7 @@ def inject_logic_bridge(query: str, data_json: str, claim_json: str) -> str:
     logger.info("Phase 2 initiated: Constructing logical bridge")
     if not data_json or not claim_json:
         logger.warning("Phase 2 rejected: Missing Phase 1 output")
-        return '{"error": "MISSING_PHASE_1_OUTPUT"}'
+        return _ERR_MISSING_PHASE_1_OUTPUT
     return prompt_phase_two(query, data_json, claim_json)
 
 
@@ -242,19 +307,16 @@ def stress_test_argument(
     If rebuttal.strength == "absolute", the ARGUMENT IS DESTROYED.
     """
     logger.info("Phase 3 initiated: Adversarial stress test")
-    missing = []
-    if not data_json:
-        missing.append("data")
-    if not claim_json:
-        missing.append("claim")
-    if not warrant_json:
-        missing.append("warrant")
-    if not backing_json:
-        missing.append("backing")
-
-    if missing:
-        logger.warning(f"Phase 3 rejected: Missing components {missing}")
-        return f'{{"error": "MISSING_COMPONENTS", "missing": {missing}}}'
+    if not (data_json and claim_json and warrant_json and backing_json):
+        components = {
+            "data": data_json,
+            "claim": claim_json,
+            "warrant": warrant_json,
+            "backing": backing_json,
+        }
+        missing = [name for name, value in components.items() if not value]
+        logger.warning("Phase 3 rejected: Missing components %s", missing)
+        return json.dumps({"error": "MISSING_COMPONENTS", "missing": missing})
 
     # CIRCUIT BREAKER: Validate Warrant and Backing strength
     if error_response := _validate_logic_bridge(warrant_json, backing_json):
@@ -263,19 +325,31 @@ def stress_test_argument(
     return prompt_phase_three(query, data_json, claim_json, warrant_json, backing_json)
 
 
+# Parsed (Warrant, Backing) pairs kept for Phases 3 and 4 of recent chains.
+_LOGIC_BRIDGE_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=_LOGIC_BRIDGE_CACHE_SIZE)
+def _parse_logic_bridge(
+    warrant_json: str, backing_json: str
+) -> tuple[Warrant, Backing]:
+    """Parse Warrant and Backing once per JSON pair; Phases 3 and 4 resend the same pair."""
+    return (
+        Warrant.model_validate_json(warrant_json),
+        Backing.model_validate_json(backing_json),
+    )
+
+
 def _validate_logic_bridge(warrant_json: str, backing_json: str) -> str | None:
     """Helper to validate Warrant and Backing strength. Returns error JSON if failed."""
     try:
-        from .models.components import Warrant, Backing
-
-        warrant = Warrant.model_validate_json(warrant_json)
-        backing = Backing.model_validate_json(backing_json)
+        warrant, backing = _parse_logic_bridge(warrant_json, backing_json)
     except ValueError as e:
-        logger.error(f"CIRCUIT BREAKER TRIGGERED: {str(e)}")
-        return f'{{"error": "TERMINATION_SIGNAL", "reason": "{str(e)}"}}'
+        logger.error("CIRCUIT BREAKER TRIGGERED: %s", e)
+        return _reason_error("TERMINATION_SIGNAL", e)
     except Exception as e:
-        logger.error(f"Validation error: {e}")
-        return f'{{"error": "VALIDATION_ERROR", "reason": "{str(e)}"}}'
+        logger.error("Validation error: %s", e)
+        return _reason_error("VALIDATION_ERROR", e)
 
     config = get_config()
     if not config.strict_mode:
@@ -287,8 +361,8 @@ def _validate_logic_bridge(warrant_json: str, backing_json: str) -> str | None:
         if config.fail_on_weak_backing:
             backing.logic_check()
     except ValueError as e:
-        logger.error(f"CIRCUIT BREAKER TRIGGERED: {str(e)}")
-        return f'{{"error": "TERMINATION_SIGNAL", "reason": "{str(e)}"}}'
+        logger.error("CIRCUIT BREAKER TRIGGERED: %s", e)
+        return _reason_error("TERMINATION_SIGNAL", e)
 
     return None
 
@@ -334,19 +408,19 @@ def render_verdict(
         - If qualifier.confidence_pct < 30 → verdict SHOULD be "overruled" or "remanded"
     """
     logger.info("Phase 4 initiated: Rendering final verdict")
-    required = [
-        data_json,
-        claim_json,
-        warrant_json,
-        backing_json,
-        rebuttal_json,
-        qualifier_json,
-    ]
-    if not all(required):
+    if not (
+        data_json
+        and claim_json
+        and warrant_json
+        and backing_json
+        and rebuttal_json
+        and qualifier_json
+    ):
         logger.warning("Phase 4 rejected: Incomplete argument chain")
-        return '{"error": "INCOMPLETE_CHAIN"}'
+        return _ERR_INCOMPLETE_CHAIN
 
-    # CIRCUIT BREAKER: Validate Warrant and Backing strength again (safety net)
+    # CIRCUIT BREAKER: Validate Warrant and Backing strength again (safety net).
+    # Phase 3 already parsed this pair, so this reuses the cached models.
     if error_response := _validate_logic_bridge(warrant_json, backing_json):
         return error_response
 
@@ -396,18 +470,17 @@ def format_analysis_report(
         Call this tool with all the accumulated JSON from Phases 1-4 to get a final report.
     """
     logger.info("Phase 5 initiated: Formatting analysis report")
-    required = [
-        data_json,
-        claim_json,
-        warrant_json,
-        backing_json,
-        rebuttal_json,
-        qualifier_json,
-        verdict_json,
-    ]
-    if not all(required):
+    if not (
+        data_json
+        and claim_json
+        and warrant_json
+        and backing_json
+        and rebuttal_json
+        and qualifier_json
+        and verdict_json
+    ):
         logger.warning("Phase 5 rejected: Incomplete argument chain")
-        return '{"error": "INCOMPLETE_CHAIN"}'
+        return _ERR_INCOMPLETE_CHAIN
 
     return prompt_format_report(
         query,
@@ -518,14 +591,17 @@ To analyze an argument, you must use the tools in this exact order:
 
 def main():
     """Run the Toulmini MCP server."""
+    listener = _start_log_listener()
     logger.info("Toulmini Logic Harness starting...")
-    logger.info(
-        "5 tools available: initiate_toulmin_sequence → inject_logic_bridge → "
-        "stress_test_argument → render_verdict → format_analysis_report (optional)"
-    )
+    # Counted from the registry so the banner can't drift as tools are added.
+    tool_names = [tool.name for tool in mcp._tool_manager.list_tools()]
+    logger.info("%d tools available: %s", len(tool_names), ", ".join(tool_names))
     logger.info("Resources: toulmin://model")
     logger.info("Prompts: toulmin-help")
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -31,3 +31,12 @@ def test_cli_install_writes_file(tmp_path):
     data = json.loads(target.read_text())
     assert "mcpServers" in data
     assert "toulmini" in data["mcpServers"]
+
+
+def test_registered_tool_names_matches_async_listing():
+    import asyncio
+
+    from toulmini.server import mcp
+
+    expected = {tool.name for tool in asyncio.run(mcp.list_tools())}
+    assert cli._registered_tool_names() == expected
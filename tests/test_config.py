@@ -9,6 +9,7 @@ from toulmini.config import (
     Config,
     ConfigurationError,
     get_config,
+    parse_bool,
     reset_config,
     set_config_value,
 )
@@ -91,6 +92,8 @@ def test_config_dataclass_properties():
         ("0", False),
         ("off", False),
         ("Off", False),
+        ("fAlSe", False),
+        ("oFF", False),
     ],
 )
 def test_env_bool_parsing(env_value, expected):
@@ -109,6 +112,13 @@ def test_env_bool_with_whitespace():
         assert config.strict_mode is False
 
 
+def test_parse_bool_unset_uses_default():
+    """Test that an unset value falls back to the default."""
+    assert parse_bool(None, True) is True
+    assert parse_bool(None, False) is False
+    assert parse_bool(" off ", True) is False
+
+
 # === String Environment Variable Parsing ===
 
 
@@ -289,10 +299,11 @@ def test_initial_env_snapshot_stored():
     ):
         reset_config()
         config = get_config()
+        snapshot = dict(config._initial_env)
 
-        assert config._initial_env["TOULMINI_ENABLE_COUNCIL"] == "false"
-        assert config._initial_env["TOULMINI_DEBUG"] == "true"
-        assert config._initial_env["TOULMINI_STRICT_MODE"] is None
+        assert snapshot["TOULMINI_ENABLE_COUNCIL"] == "false"
+        assert snapshot["TOULMINI_DEBUG"] == "true"
+        assert snapshot["TOULMINI_STRICT_MODE"] is None
 
 
 def test_initial_env_snapshot_reflects_unset_vars():
@@ -301,8 +312,9 @@ def test_initial_env_snapshot_reflects_unset_vars():
         reset_config()
         config = get_config()
 
-        for key in config._initial_env:
-            assert config._initial_env[key] is None
+        assert config._initial_env
+        for _key, value in config._initial_env:
+            assert value is None
 
 
 # === Integration Scenarios ===
@@ -400,6 +412,7 @@ def test_module_exports_all_public_apis():
     assert hasattr(config, "Config")
     assert hasattr(config, "ConfigurationError")
     assert hasattr(config, "get_config")
+    assert hasattr(config, "parse_bool")
     assert hasattr(config, "set_config_value")
     assert hasattr(config, "reset_config")
 
@@ -408,6 +421,7 @@ def test_module_exports_all_public_apis():
         "Config",
         "ConfigurationError",
         "get_config",
+        "parse_bool",
         "set_config_value",
         "reset_config",
     }
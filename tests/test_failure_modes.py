@@ -1,3 +1,5 @@
+import json
+
 from toulmini.server import stress_test_argument
 
 
@@ -57,6 +59,7 @@ def test_missing_components_in_phase3():
     assert "MISSING_COMPONENTS" in result
     assert "warrant" in result
     assert "backing" in result
+    assert json.loads(result)["missing"] == ["warrant", "backing"]
 
 
 def test_incomplete_chain_in_phase4():
@@ -67,3 +70,17 @@ def test_incomplete_chain_in_phase4():
     # Missing rebuttal and qualifier
     result = render_verdict(query, "{}", "{}", "{}", "{}", "", "")
     assert "INCOMPLETE_CHAIN" in result
+
+
+def test_validation_error_reason_is_valid_json():
+    """Test that multi-line Pydantic errors are escaped in the error payload."""
+    query = "Some query"
+    warrant_json = (
+        '{"principle": "Too short", "logic_type": "deductive", "strength": "strong"}'
+    )
+    backing_json = '{"authority": "Valid Authority Name", "citations": [{"source": "S", "reference": "R"}], "strength": "strong"}'
+
+    result = stress_test_argument(query, "{}", "{}", warrant_json, backing_json)
+    payload = json.loads(result)
+    assert payload["error"] == "TERMINATION_SIGNAL"
+    assert "principle" in payload["reason"]
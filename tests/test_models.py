@@ -1,5 +1,8 @@
+from typing import get_args
+
 import pytest
 from pydantic import ValidationError
+from toulmini.models import WEAK_STRENGTHS, StrengthLevel
 from toulmini.models.components import (
     Claim,
     Warrant,
@@ -98,6 +101,11 @@ def test_backing_logic_check():
         weak_backing.logic_check()
 
 
+def test_weak_strengths_are_valid_levels():
+    assert WEAK_STRENGTHS == {"weak", "irrelevant"}
+    assert WEAK_STRENGTHS <= set(get_args(StrengthLevel))
+
+
 def test_rebuttal_logic_check():
     # Valid rebuttal (weak attack means argument stands)
     rebuttal = Rebuttal(exceptions=["Exception 1"], strength="weak")
@@ -109,37 +117,72 @@ def test_rebuttal_logic_check():
         fatal_rebuttal.logic_check()
 
 
-def test_verdict_consistency():
-    # Valid sustained
-    Verdict(
-        status="sustained",
-        reasoning="This reasoning supports the claim and explains why it succeeds perfectly well.",
-        final_statement="Final statement.",
-    )
+@pytest.mark.parametrize(
+    "status, reasoning",
+    [
+        (
+            "sustained",
+            "This reasoning supports the claim and explains why it succeeds perfectly well.",
+        ),
+        (
+            "overruled",
+            "This reasoning explains why the claim fails and is rejected completely.",
+        ),
+    ],
+)
+def test_verdict_consistency(status, reasoning):
+    Verdict(status=status, reasoning=reasoning, final_statement="Final statement.")
+
+
+@pytest.mark.parametrize(
+    "status, reasoning",
+    [
+        # Sustained but fails
+        ("sustained", "This reasoning explains why the claim fails miserably."),
+        # Overruled but succeeds
+        ("overruled", "This reasoning explains why the claim succeeds perfectly."),
+        # Consistency terms are matched case-insensitively
+        (
+            "sustained",
+            "This reasoning shows the claim was REJECTED by every reviewer.",
+        ),
+    ],
+)
+def test_verdict_inconsistency(status, reasoning):
+    with pytest.raises(ValidationError, match="VERDICT INCONSISTENT"):
+        Verdict(status=status, reasoning=reasoning, final_statement="Final statement.")
 
-    # Valid overruled
-    Verdict(
-        status="overruled",
-        reasoning="This reasoning explains why the claim fails and is rejected completely.",
-        final_statement="Final statement.",
-    )
 
-    # Inconsistent: sustained but fails
-    with pytest.raises(ValidationError, match="VERDICT INCONSISTENT"):
-        Verdict(
-            status="sustained",
-            reasoning="This reasoning explains why the claim fails miserably.",
-            final_statement="Final statement.",
-        )
+def test_citation_validation():
+    # Direct construction enforces non-empty, string fields
+    with pytest.raises(ValidationError):
+        Citation(source="", reference="Page 1")
+    with pytest.raises(ValidationError):
+        Citation(source=1, reference=2)
 
-    # Inconsistent: overruled but succeeds
-    with pytest.raises(ValidationError, match="VERDICT INCONSISTENT"):
-        Verdict(
-            status="overruled",
-            reasoning="This reasoning explains why the claim succeeds perfectly.",
-            final_statement="Final statement.",
+    # Nested citations are validated by Pydantic
+    with pytest.raises(ValidationError):
+        Data(
+            facts=["Fact 1"],
+            citations=[{"source": "S", "reference": "R", "extra": "x"}],
+            evidence_type="empirical",
         )
 
+    data = Data(
+        facts=["Fact 1"],
+        citations=[{"source": "S", "reference": "R"}],
+        evidence_type="empirical",
+    )
+    assert data.citations == [Citation(source="S", reference="R")]
+
+
+def test_components_are_frozen():
+    with pytest.raises(ValidationError):
+        valid_warrant.strength = "weak"
+
+    same = Claim(statement=valid_claim.statement, scope=valid_claim.scope)
+    assert hash(same) == hash(valid_claim)
+
 
 # --- Chain Tests ---
 
@@ -160,28 +203,54 @@ def test_chain_completeness():
     chain.run_logic_checks()
 
 
-def test_chain_dependencies():
-    # Missing Data for Claim
-    with pytest.raises(ValidationError, match="Claim requires Data"):
-        ToulminChain(query="Test", claim=valid_claim)
+def test_chain_phase_tracks_updates():
+    chain = ToulminChain(query="Test", data=valid_data, claim=valid_claim)
+    assert chain.phase == 1
 
-    # Missing Claim for Warrant
-    with pytest.raises(ValidationError, match="Warrant requires Claim"):
-        ToulminChain(
-            query="Test",
-            data=valid_data,
-            # no claim
-            warrant=valid_warrant,
-        )
+    chain.warrant = valid_warrant
+    chain.backing = valid_backing
+    assert chain.phase == 2
 
-    # Missing Warrant for Backing
-    with pytest.raises(ValidationError, match="Backing requires Warrant"):
+    copied = chain.model_copy(
+        update={
+            "rebuttal": valid_rebuttal,
+            "qualifier": valid_qualifier,
+            "verdict": valid_verdict,
+        }
+    )
+    assert copied.phase == 4
+    assert chain.phase == 2
+    assert "phase" not in chain.model_dump()
+
+
+@pytest.mark.parametrize(
+    "components, message",
+    [
+        # Missing Data for Claim
+        ({"claim": valid_claim}, "Claim requires Data"),
+        # Missing Claim for Warrant
+        ({"data": valid_data, "warrant": valid_warrant}, "Warrant requires Claim"),
+        # Missing Warrant for Backing
+        (
+            {"data": valid_data, "claim": valid_claim, "backing": valid_backing},
+            "Backing requires Warrant",
+        ),
+    ],
+)
+def test_chain_dependencies(components, message):
+    with pytest.raises(ValidationError, match=message):
+        ToulminChain(query="Test", **components)
+
+
+def test_chain_verdict_requires_all_components():
+    with pytest.raises(ValidationError, match="Verdict requires Rebuttal, Qualifier"):
         ToulminChain(
             query="Test",
             data=valid_data,
             claim=valid_claim,
-            # no warrant
+            warrant=valid_warrant,
             backing=valid_backing,
+            verdict=valid_verdict,
         )
 
 
@@ -3,13 +3,10 @@
 import json
 import sys
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
-# Import from scripts directory
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-from setup_mcp import (
+from toulmini.mcp_setup import (
     generate_config,
     get_project_root,
     get_python_path,
@@ -77,6 +74,30 @@ def test_is_installed_in_site_packages():
     # We can't assert a specific value as it depends on test environment
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+def test_is_installed_in_symlinked_site_packages(tmp_path, monkeypatch):
+    """Test that a symlinked site-packages directory is still detected."""
+    import site
+
+    from toulmini import mcp_setup
+
+    real = tmp_path / "real-site-packages"
+    (real / "toulmini").mkdir(parents=True)
+    link = tmp_path / "site-packages"
+    link.symlink_to(real)
+
+    monkeypatch.setattr(
+        mcp_setup, "_package_dir", lambda: (real / "toulmini").resolve()
+    )
+    monkeypatch.setattr(site, "getsitepackages", lambda: [str(link)])
+    monkeypatch.setattr(site, "getusersitepackages", lambda: "")
+    is_installed_in_site_packages.cache_clear()
+    try:
+        assert is_installed_in_site_packages() is True
+    finally:
+        is_installed_in_site_packages.cache_clear()
+
+
 # === Config Generation Tests ===
 
 
@@ -120,18 +141,19 @@ def test_generate_config_source_installation():
     assert toulmini_config["env"]["PYTHONPATH"] == str(project_root)
 
 
-def test_generate_config_different_python_paths():
-    """Test config generation with various Python paths."""
-    test_paths = [
+@pytest.mark.parametrize(
+    "python_path",
+    [
         "/usr/bin/python3",
         "/opt/homebrew/bin/python3.11",
         "C:\\Python311\\python.exe",
         "/home/user/.pyenv/versions/3.11.0/bin/python",
-    ]
-
-    for python_path in test_paths:
-        config = generate_config(python_path, Path("/dummy"), True)
-        assert config["mcpServers"]["toulmini"]["command"] == python_path
+    ],
+)
+def test_generate_config_different_python_paths(python_path):
+    """Test config generation with various Python paths."""
+    config = generate_config(python_path, Path("/dummy"), True)
+    assert config["mcpServers"]["toulmini"]["command"] == python_path
 
 
 # === File Writing Tests ===
@@ -235,21 +257,20 @@ def test_write_config_creates_parent_directories(tmp_path):
     assert nested_path.parent.exists()
 
 
-def test_write_config_expands_tilde(tmp_path):
+def test_write_config_expands_tilde(tmp_path, monkeypatch):
     """Test that ~ is expanded in file paths."""
-    # Create a mock path with ~
-    with patch("pathlib.Path.expanduser") as mock_expand:
-        # Make expanduser return a path in tmp_path
-        expanded_path = tmp_path / "config.json"
-        mock_expand.return_value = expanded_path
+    # Point the home directory at tmp_path (HOME on POSIX, USERPROFILE on Windows)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
 
-        snippet = {"toulmini": {"command": "python", "args": ["-m", "toulmini.server"]}}
+    snippet = {"toulmini": {"command": "python", "args": ["-m", "toulmini.server"]}}
 
-        # Call with ~ path
-        _write_config(Path("~/config.json"), snippet)
+    # Call with ~ path
+    _write_config(Path("~/config.json"), snippet)
 
-        # expanduser should have been called
-        mock_expand.assert_called()
+    # The file should land under the expanded home directory
+    assert (tmp_path / "config.json").exists()
+    assert not Path("~").exists()
 
 
 def test_write_config_handles_corrupted_json(temp_config_file, capsys):
@@ -263,8 +284,8 @@ def test_write_config_handles_corrupted_json(temp_config_file, capsys):
     _write_config(temp_config_file, snippet)
 
     # Should have warning in output
-    captured = capsys.readouterr()
-    assert "invalid" in captured.out.lower() or "warning" in captured.out.lower()
+    output = capsys.readouterr().out.lower()
+    assert "invalid" in output or "warning" in output
 
     # File should now contain valid JSON
     with open(temp_config_file, "r") as f:
@@ -274,26 +295,18 @@ def test_write_config_handles_corrupted_json(temp_config_file, capsys):
     assert "toulmini" in data["mcpServers"]
 
 
-def test_write_config_preserves_formatting():
+def test_write_config_preserves_formatting(temp_config_file):
     """Test that written JSON is properly formatted (indented)."""
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-        temp_path = Path(f.name)
+    snippet = {"toulmini": {"command": "python", "args": ["-m", "toulmini.server"]}}
 
-    try:
-        snippet = {"toulmini": {"command": "python", "args": ["-m", "toulmini.server"]}}
+    _write_config(temp_config_file, snippet)
 
-        _write_config(temp_path, snippet)
+    # Read raw content
+    content = temp_config_file.read_text()
 
-        # Read raw content
-        content = temp_path.read_text()
-
-        # Should be indented (contain newlines and spaces)
-        assert "\n" in content
-        assert "  " in content  # 2-space indent
-    finally:
-        temp_path.unlink()
+    # Should be indented (contain newlines and spaces)
+    assert "\n" in content
+    assert "  " in content  # 2-space indent
 
 
 # === Print Instructions Tests ===
@@ -363,6 +376,30 @@ def test_config_snippet_is_json_serializable():
     assert parsed == snippet
 
 
+def test_cached_snippet_json_matches_config():
+    """Test that the cached JSON snippet mirrors the cached config."""
+    from toulmini.mcp_setup import _cached_generate_config, _snippet_json
+
+    assert _snippet_json() is _snippet_json()
+    assert json.loads(_snippet_json()) == _cached_generate_config()["mcpServers"]
+
+
+def test_write_config_preserves_existing_values(temp_config_file):
+    """Test that merging keeps values only the stdlib parser round-trips."""
+    from toulmini import mcp_setup
+
+    temp_config_file.write_bytes(
+        b'{"mcpServers": {"other": {}}, "big": 18446744073709551617, "nan": NaN}'
+    )
+
+    mcp_setup._write_config(temp_config_file, {"toulmini": {"command": "python"}})
+
+    data = json.loads(temp_config_file.read_text(encoding="utf-8"))
+    assert set(data["mcpServers"]) == {"other", "toulmini"}
+    assert data["big"] == 18446744073709551617
+    assert data["nan"] != data["nan"]
+
+
 # === Edge Cases ===
 
 
@@ -376,6 +413,10 @@ def test_generate_config_empty_project_root():
     assert config["mcpServers"]["toulmini"]["env"]["PYTHONPATH"] == "."
 
 
+@pytest.mark.skipif(
+    sys.getfilesystemencoding().lower().replace("-", "") != "utf8",
+    reason="Filesystem encoding cannot represent the test paths",
+)
 def test_write_config_with_unicode_paths(tmp_path):
     """Test writing config with unicode characters in path."""
     unicode_dir = tmp_path / "カタカナ" / "中文"